@@ -1,9 +1,49 @@
-import os
+import sys
+from functools import lru_cache
+from operator import attrgetter
 from .utils import main_scene, txtcolours, printd, Vec2D, force_types, sleep
 from .input import Input
 from .camera import Camera
 from . import utils
 
+# The void character `¶` is drawn as a space, but unlike a space it is never transparent
+_void_table = str.maketrans("¶", " ")
+
+@lru_cache(maxsize=8192)
+def _paint(colour: str, pixel: str) -> str:
+	"""Return the stage cell for a character drawn in a colour. Scenes only use a handful of colour and character pairs, so these are cached rather than formatted for every pixel of every render"""
+	return f"{colour}{pixel}{txtcolours.END if colour else ''}"
+
+@lru_cache(maxsize=1024)
+def _compile_image(image: str, extra_characters: tuple[int, ...], transparent: bool, colour: str) -> tuple[int, int, tuple[str, ...], tuple[tuple, ...]]:
+	"""Return the width and height of a Sprite's image, its rows (each padded to the full width of the sprite plus its extra characters) and the stage cells to draw for each row. In those, void characters are already spaces, the colour is already applied and transparent spaces are None. Cached, so switching between an AnimatedSprite's frames doesn't reparse them"""
+	lines = image.split("\n")
+	width = len(max(lines, key= lambda x: len(x)))
+	rows = [line + "​"*n for line, n in zip(lines, extra_characters)] + lines[len(extra_characters):] # Add zero width spaces
+	padding = list(extra_characters) + [0] * (len(rows) - len(extra_characters))
+	rows = tuple(row.ljust(width + n) for row, n in zip(rows, padding))
+	cells = tuple(
+		tuple(None if transparent and pixel == " " else _paint(colour, cell) for pixel, cell in zip(row, row.translate(_void_table)))
+		for row in rows
+	)
+	return width, len(lines), rows, cells
+
+@lru_cache(maxsize=None)
+def _has_stock_hooks(cls: type) -> bool:
+	"""Return true if the class is an Entity or Sprite that keeps their own `get_pixel` and `all_positions`, so its instances can be drawn straight from their rows of cells. Subclasses that override either have to go through them"""
+	if not issubclass(cls, Entity):
+		return False
+	base = Sprite if issubclass(cls, Sprite) else Entity
+	return cls.get_pixel is base.get_pixel and cls.all_positions is base.all_positions and cls._pixel_rows is base._pixel_rows
+
+def _has_instance_hooks(entity) -> bool:
+	"""Return true if `get_pixel` or `all_positions` was assigned on the entity itself rather than defined by its class"""
+	return "get_pixel" in entity.__dict__ or "all_positions" in entity.__dict__
+
+def _uses_stock_hooks(entity) -> bool:
+	"""Return true if the entity can be drawn straight from its rows of cells, see `_has_stock_hooks`"""
+	return _has_stock_hooks(type(entity)) and not _has_instance_hooks(entity)
+
 # -- Entities --
 
 class RawEntity:
@@ -11,6 +51,13 @@ class RawEntity:
 	Barebones entity object for custom objects. no collisions, no `move()`, no size, just the barebones"""
 
 	_parent = None
+	# Changing any of these means the entity has to be redrawn by its parent scene
+	_render_attributes = {"pos", "size", "visible", "layer", "colour", "fill_char", "image", "transparent", "extra_characters", "pos0", "pos1", "vertices"}
+
+	def __setattr__(self, name, value):
+		super().__setattr__(name, value)
+		if name in self._render_attributes and self._parent:
+			self._parent._dirty_entities[id(self)] = self
 
 	@property
 	def parent(self):
@@ -19,6 +66,8 @@ class RawEntity:
 	def parent(self, value: 'Scene'):
 		if (self._parent != value or value is None) and self._parent:
 			self._parent.children.remove(self)
+			self._parent._dirty_entities[id(self)] = self
+			self._parent._sort_dirty = True
 		if value != None:
 			value.add_to_scene(self)
 
@@ -27,7 +76,24 @@ class RawEntity:
 		return Vec2D(self._pos)
 	@pos.setter
 	def pos(self, value: Vec2D):
-		self._pos = Vec2D(value) % self.parent.size if self.parent else Vec2D(value)
+		self._set_pos(value[0], value[1])
+
+	def _set_pos(self, x: int, y: int):
+		"""Store the position wrapped to the parent scene, building only one Vec2D"""
+		x, y = int(x), int(y)
+		if self._parent:
+			size = self._parent.size
+			x, y = x % size.x, y % size.y
+		self._pos = Vec2D(x, y)
+	@property
+	def layer(self):
+		return self._layer
+	@layer.setter
+	def layer(self, value: int):
+		self._layer = value
+		if self._parent:
+			self._parent._sort_dirty = True
+
 	@property
 	def all_positions(self):
 		return []
@@ -45,6 +111,10 @@ class RawEntity:
 		"""All children of this class should have return a character using the get_pixel function"""
 		return "█"
 
+	def contains(self, pos: Vec2D) -> bool:
+		"""Return true if the entity covers the chosen position in its scene"""
+		return pos in self.all_positions
+
 class Entity(RawEntity):
 	"""## Entity
 	The Entity is the most basic object in a Gemini Scene. It is simply a rectangle of your chosen proportions. You can create a new entity like so.
@@ -94,27 +164,24 @@ class Entity(RawEntity):
 			if collide is None:
 				collide = self.collisions
 			if collide:
-				positions = self.all_positions
-				def step_collide(axis: utils.Axis, p):
+				positions = [(pos[0], pos[1]) for pos in self.all_positions]
+				# Nothing else moves during this move, so find everything we could hit once
+				occupied = self.parent.get_occupied_positions(collide, exclude=[self])
+				def step_collide(p, unit: tuple[int, int]):
 					if p == 0:
 						return
 					colliding = abs(p)
 					polarity = (1 if p > 0 else -1)
 					for j in range(colliding):
-						for pos in positions:
-							new_pos = pos + axis.vector((j+1)*polarity)
-							collisions = self.parent.get_entities_at(new_pos, collide)
-							collisions = list(filter(lambda x: self != x, collisions))
-							if collisions:
-								nonlocal has_collided
-								colliding, has_collided = j, True
-
-						if colliding < abs(p):
+						dx, dy = unit[0]*(j+1)*polarity, unit[1]*(j+1)*polarity
+						if any((x+dx, y+dy) in occupied for x, y in positions):
+							nonlocal has_collided
+							colliding, has_collided = j, True
 							break
-					self.pos += axis.vector(colliding * polarity)
+					self.pos += (unit[0]*colliding*polarity, unit[1]*colliding*polarity)
 
-				step_collide(utils.Axis.X, move.x)
-				step_collide(utils.Axis.Y, move.y)
+				step_collide(move.x, (1, 0))
+				step_collide(move.y, (0, 1))
 			else:
 				self.pos += move
 
@@ -130,6 +197,19 @@ class Entity(RawEntity):
 	def get_pixel(self, _):
 		return self.fill_char
 
+	def contains(self, pos: Vec2D) -> bool:
+		"""Return true if the entity covers the chosen position in its scene. Unlike checking `all_positions`, this doesn't have to list every position the entity covers, unless a subclass decides which positions those are"""
+		if not _uses_stock_hooks(self):
+			return super().contains(pos)
+		width, height = self.parent.size
+		if not (0 <= pos[0] < width and 0 <= pos[1] < height):
+			return False
+		return (pos[0] - self._pos.x) % width < self.size[0] and (pos[1] - self._pos.y) % height < self.size[1]
+
+	def _pixel_rows(self) -> list[list[str]]:
+		"""Return every row of stage cells to draw for the entity, starting from its top left corner. None is used for transparent pixels"""
+		return [[_paint(self.colour, self.fill_char[0].translate(_void_table))] * self.size[0]] * self.size[1]
+
 class Point(Entity):
 	"""## Point
 	A child of `Entity` with size (1,1). Helpful for temporary points in renders, simply add `gemini.Point.clear_points(scene)` to `scene.render_functions` (`scene` being your Scene instance)"""
@@ -261,7 +341,34 @@ class Sprite(Entity):
 	@image.setter
 	def image(self, value: str):
 		self._image = value
-		self.size = Vec2D(len(max(value.split("\n"), key= lambda x: len(x))), value.count("\n") + 1)
+		self._compile()
+
+	@property
+	def colour(self):
+		return self._colour
+	@colour.setter
+	def colour(self, value: str):
+		self._colour = value
+		if hasattr(self, "_image"):
+			self._compile()
+
+	@property
+	def transparent(self):
+		return self._transparent
+	@transparent.setter
+	def transparent(self, value: bool):
+		self._transparent = value
+		if hasattr(self, "_image"):
+			self._compile()
+
+	@property
+	def extra_characters(self):
+		return self._extra_characters
+	@extra_characters.setter
+	def extra_characters(self, value: list[int]):
+		self._extra_characters = value
+		if hasattr(self, "_image"):
+			self._compile()
 
 	@property
 	def render_image(self):
@@ -272,15 +379,12 @@ class Sprite(Entity):
 		return '\n'.join(render_image)
 	@property
 	def all_positions(self):
-		raw_positions = []
-		for j in range(self.size[1]):
-			length = self.size[0] + (
-				self.extra_characters[j] if len(self.extra_characters) > j else 0
-			)
-			raw_positions.extend([(i,j) for i in range(length)])
+		pos, size = self.pos, self.parent.size
 		return [
-			(self.pos + pos) % self.parent.size for pos in raw_positions
-			if self.get_pixel(pos) != " " or not self.transparent
+			(pos + (i,j)) % size
+			for j, line in enumerate(self._pixel_rows())
+			for i, pixel in enumerate(line)
+			if pixel is not None
 		]
 
 	def __init__(self, pos: Vec2D, image: str, transparent: bool=True, extra_characters: list=[], *args, **kwargs):
@@ -294,11 +398,41 @@ class Sprite(Entity):
 		return f"Sprite(pos={self.pos},image='{self._image[:10]}{'...' if len(self._image) > 10 else ''}')"
 
 	def get_pixel(self, pos: Vec2D) -> str:
+		self._recompile_if_stale()
 		try:
-			return self.render_image.split("\n")[pos[1]][pos[0]]
+			return self._lines[pos[1]][pos[0]]
 		except Exception:
 			return " "
 
+	def contains(self, pos: Vec2D) -> bool:
+		if not _uses_stock_hooks(self):
+			return RawEntity.contains(self, pos)
+		width, height = self.parent.size
+		if not (0 <= pos[0] < width and 0 <= pos[1] < height):
+			return False
+		rows = self._pixel_rows()
+		# Sprites bigger than the scene wrap over themselves, so more than one pixel can land on the position
+		for j in range((pos[1] - self._pos.y) % height, len(rows), height):
+			for i in range((pos[0] - self._pos.x) % width, len(rows[j]), width):
+				if rows[j][i] is not None:
+					return True
+		return False
+
+	def _compile(self):
+		"""Parse the image into `_lines` and `_cells` once, so rendering and collisions never have to split or colour it"""
+		self._compiled_extra_characters = tuple(self._extra_characters)
+		width, height, self._lines, self._cells = _compile_image(self._image, self._compiled_extra_characters, self._transparent, self._colour)
+		self.size = Vec2D(width, height)
+
+	def _recompile_if_stale(self):
+		"""Compile the image again if the `extra_characters` list was edited in place since it was last compiled"""
+		if tuple(self._extra_characters) != self._compiled_extra_characters:
+			self._compile()
+
+	def _pixel_rows(self) -> tuple[tuple, ...]:
+		self._recompile_if_stale()
+		return self._cells
+
 class AnimatedSprite(Sprite):
 	"""## AnimatedSprite
 	The AnimatedSpite object works the same way as the Sprite class, but accepts a list of images instead of only one, and can be set which to show with the `current_frame` value. The `image` property will now return the current frame as an image
@@ -335,6 +469,9 @@ class AnimatedSprite(Sprite):
 	def prev_frame(self):
 		self.current_frame -= 1
 
+# Entities of any other class, or with their own `get_pixel` or `all_positions`, may draw from attributes the scene can't watch, so they are redrawn on every render
+_BUILTIN_ENTITIES = (RawEntity, Entity, Point, Line, Polygon, Sprite, AnimatedSprite)
+
 # -- Scene --
 
 class Scene:
@@ -352,7 +489,6 @@ class Scene:
 
 	The `render_functions` parameter is to be a list of functions to run before any render, except when the `run_functions` parameter is set to False"""
 
-	_void_char = '¶'
 	debug_display = ""
 
 	@property
@@ -366,6 +502,7 @@ class Scene:
 	@origin.setter
 	def origin(self, value):
 		self._origin = value
+		self.invalidate()
 
 	@property
 	def is_main_scene(self):
@@ -374,10 +511,39 @@ class Scene:
 	def is_main_scene(self, value):
 		main_scene.main_scene = self if value else None
 
+	@property
+	def size(self):
+		return self._size
+	@size.setter
+	def size(self, value: Vec2D):
+		self._size = Vec2D(value)
+		self._baked_stage: list[list] = None # The stage has to be rebuilt at the new size
+		self.invalidate()
+
+	@property
+	def clear_char(self):
+		return self._clear_char
+	@clear_char.setter
+	def clear_char(self, value: str):
+		self._clear_char = value
+		self._background_tile = None
+		self.invalidate()
+
+	@property
+	def bg_colour(self):
+		return self._bg_colour
+	@bg_colour.setter
+	def bg_colour(self, value: str):
+		self._bg_colour = value
+		self._background_tile = None
+		self.invalidate()
+
 	@property
 	def background_tile(self):
 		"""Return the background character with colours included"""
-		return f"{self.bg_colour}{self.clear_char}{txtcolours.END if self.bg_colour != '' else ''}"
+		if self._background_tile is None:
+			self._background_tile = f"{self.bg_colour}{self.clear_char}{txtcolours.END if self.bg_colour != '' else ''}"
+		return self._background_tile
 
 	def __init__(self, size: Vec2D, clear_char="░", bg_colour="", children: list[RawEntity]=[], render_functions: list=None, is_main_scene=False, origin="topleft"):
 		self.size = Vec2D(size)
@@ -400,6 +566,27 @@ class Scene:
 		"""Add an entity to the scene. This can be used instead of directly defining the entity's parent, or if you want to move the entity between different scenes"""
 		self.children.append(new_entity)
 		new_entity._parent = self
+		# Forget where the entity was last drawn so it is redrawn in full, on top of anything it was previously under
+		self._dirty_rects += self._baked_rects.pop(id(new_entity), (None, [], None))[1]
+		self._dirty_entities[id(new_entity)] = new_entity
+		self._sort_dirty = True
+
+	def invalidate(self):
+		"""Throw away the cached render, so the whole scene is redrawn on the next render. This happens automatically when the scene's size, origin or background change"""
+		self._full_redraw = True
+		self._baked_children: list[RawEntity] = []
+		# Entities are keyed by id, so that subclasses with their own `__eq__` (and so no `__hash__`) still work
+		self._baked_rects: dict[int, tuple] = {}
+		self._dirty_rects: list[tuple] = []
+		self._dirty_entities: dict[int, RawEntity] = {}
+		self._sort_dirty = True
+
+	def _get_render_order(self) -> list[RawEntity]:
+		"""Return the scene's children in the order they are drawn. They are only sorted again after an entity is added, removed or changes layer"""
+		if self._sort_dirty:
+			self._children_sorted = sorted(self.children, key=attrgetter("layer"), reverse=True)
+			self._sort_dirty = False
+		return self._children_sorted
 
 	def clear_points(self):
 		"""Remove all `Point` objects"""
@@ -409,7 +596,7 @@ class Scene:
 	def get_separator(self, used_lines=None):
 		"""Create a separator to put above display so that you can only see one rendered scene at a time [[DEPRECATED]]"""
 
-		return "\n" * (os.get_terminal_size().lines - (used_lines or self.size[1]))
+		return "\n" * (utils.get_terminal_lines() - (used_lines or self.size[1]))
 
 	def _render_stage(self, stage: list[list], show_coord_numbers=False, use_rewrite=True, use_clear=False, starting_coords=(0,0)):
 		"""Return a baked scene, ready for printing. This will take your grid of strings and render it. You can also set `show_coord_numbers=True` to print your scene with coordinate numbers for debugging purposes"""
@@ -419,10 +606,160 @@ class Scene:
 				c.insert(0, str(i)[-1:])
 			stage.insert( 0, [' '] + [ str(starting_coords[0]+i)[-1:] for i in range(len(stage[0])-1) ] )
 
-		rows = ["".join(row) for row in stage]
-		visible_lines = 0 if os.get_terminal_size().lines > self.size.y else self.size.y - os.get_terminal_size().lines + 2
+		return self._frame(["".join(row) for row in stage], use_rewrite, use_clear)
+
+	def _frame(self, rows: list[str], use_rewrite=True, use_clear=False) -> str:
+		"""Return a frame ready for printing from the already joined rows of a stage"""
+		terminal_lines = utils.get_terminal_lines()
+		visible_lines = 0 if terminal_lines > self.size.y else self.size.y - terminal_lines + 2
 		return ("\x1b[H" if use_rewrite else "") + ("\x1b[J" if use_clear else "") + "\n".join(rows[visible_lines:]) + "\x1b[J\n"
 
+	def _display(self, frame: str):
+		"""Write a frame made by `_render_stage` to the terminal with a single write and flush, so it is never shown half drawn"""
+		sys.stdout.write(frame + "\n")
+		sys.stdout.flush()
+
+	def _entity_rects(self, entity: RawEntity, origin: Vec2D) -> list[tuple]:
+		"""Return the areas of the stage covered by an entity as `(x1, y1, x2, y2)` rectangles"""
+		if _uses_stock_hooks(entity):
+			rows = entity._pixel_rows()
+			return utils.wrap_rect(entity.pos + origin, (max(map(len, rows), default=0), len(rows)), self.size)
+		positions = [(position + origin) % self.size for position in entity.all_positions]
+		if not positions:
+			return []
+		xs, ys = [p.x for p in positions], [p.y for p in positions]
+		return [(min(xs), min(ys), max(xs) + 1, max(ys) + 1)]
+
+	def _entity_signature(self, entity: RawEntity):
+		"""Everything that decides what a uniformly filled entity looks like. Moving such an entity doesn't change the area its old and new positions share. Returns None for any other entity"""
+		if _uses_stock_hooks(entity) and not isinstance(entity, Sprite):
+			return entity.fill_char, entity.colour, entity.layer, tuple(entity.size)
+
+	def _blit(self, stage: list[list], entity: RawEntity, origin: Vec2D, clip: tuple=None):
+		"""Draw an entity onto the stage, only within the `clip` rectangle if one is given. Plain entities are filled with slices, Sprites are drawn a row at a time from precomputed wrapped coordinates and anything else (including subclasses or instances with their own `get_pixel` or `all_positions`) falls back to `all_positions`"""
+		x1, y1, x2, y2 = clip or (0, 0, *self.size)
+		width, height = self.size
+		stock = _uses_stock_hooks(entity)
+		if stock and not isinstance(entity, Sprite):
+			# Every row of a plain entity is the same, so each one is filled with a single slice assignment
+			cell = _paint(entity.colour, entity.fill_char[0].translate(_void_table))
+			for rx1, ry1, rx2, ry2 in utils.wrap_rect(entity.pos + origin, entity.size, self.size):
+				rx1, ry1, rx2, ry2 = max(rx1, x1), max(ry1, y1), min(rx2, x2), min(ry2, y2)
+				if rx1 < rx2:
+					row_slice = [cell] * (rx2 - rx1)
+					for y in range(ry1, ry2):
+						stage[y][rx1:rx2] = row_slice
+			return
+
+		rows = entity._pixel_rows() if stock else ()
+		# A Sprite bigger than the scene wraps over itself, and each cell it covers shows the pixel at its wrapped offset
+		if not stock or len(rows) > height or max(map(len, rows), default=0) > width:
+			for position in entity.all_positions:
+				position = (position + origin) % self.size
+				if not (x1 <= position[0] < x2 and y1 <= position[1] < y2):
+					continue
+				pixel = entity.get_pixel((position - entity.pos - origin) % self.size)[0]
+				stage[position[1]][position[0]] = _paint(entity.colour, pixel.translate(_void_table))
+			return
+
+		x0, y0 = entity.pos + origin
+		# Only visit the columns that land inside the clip rectangle
+		columns = [(i, x) for i in range(max(map(len, rows), default=0)) if x1 <= (x := (x0 + i) % width) < x2]
+		if not columns:
+			return
+		for j, line in enumerate(rows):
+			y = (y0 + j) % height
+			if not y1 <= y < y2:
+				continue
+			stage_row, length = stage[y], len(line)
+			for i, x in columns:
+				if i >= length:
+					break
+				if (cell := line[i]) is not None:
+					stage_row[x] = cell
+
+	def _bake(self, origin: Vec2D) -> list[list]:
+		"""Bring the cached render of all visible entities up to date and return it. After the first render, only the areas covered by entities that changed since the last render (where they were and where they are now) are redrawn"""
+		stage, (width, height) = self._baked_stage, self.size
+		if stage is not None and (len(stage), len(stage[0]) if stage else width) != (height, width):
+			# The scene's size was edited in place
+			self._baked_stage = None
+			self.invalidate()
+		if len(self.children) != len(self._baked_children) or any(a is not b for a, b in zip(self.children, self._baked_children)):
+			# `children` was edited directly instead of through an entity's `parent`
+			children = {id(entity): entity for entity in self.children}
+			baked_children = {id(entity): entity for entity in self._baked_children}
+			changed = {key: entity for key, entity in (children | baked_children).items() if (key in children) != (key in baked_children)}
+			self._dirty_entities.update(changed)
+			self._sort_dirty = True
+			if not changed: # Only the order changed, which can change which entity is drawn on top
+				self._full_redraw = True
+			self._baked_children = self.children[:]
+
+		entity_list = [entity for entity in self._get_render_order() if entity.visible]
+
+		if self._full_redraw:
+			background = self.background_tile
+			if self._baked_stage is None:
+				self._baked_stage = [[background] * width for _ in range(height)]
+			else: # Clear the existing stage in place rather than building a new one
+				fill = [background] * width
+				for row in self._baked_stage:
+					row[:] = fill
+			self._baked_rows = [None] * height
+			self._baked_rects = {}
+			for entity in entity_list:
+				self._blit(self._baked_stage, entity, origin)
+				self._baked_rects[id(entity)] = (entity, self._entity_rects(entity, origin), self._entity_signature(entity))
+			self._dirty_rects.clear()
+			self._dirty_entities.clear()
+			self._full_redraw = False
+			return self._baked_stage
+
+		for entity in entity_list:
+			if type(entity) not in _BUILTIN_ENTITIES or _has_instance_hooks(entity):
+				self._dirty_entities[id(entity)] = entity
+			elif isinstance(entity, Sprite):
+				entity._recompile_if_stale() # Marks the sprite dirty if it had to be compiled again
+		for key, (entity, rects, signature) in self._baked_rects.items():
+			if signature is not None and signature != self._entity_signature(entity):
+				# Something like the entity's size was edited in place
+				self._dirty_entities[key] = entity
+
+		child_ids = {id(entity) for entity in self.children} if self._dirty_entities else set()
+		for key, entity in self._dirty_entities.items():
+			_, old_rects, old_signature = self._baked_rects.pop(key, (None, [], None))
+			new_rects, new_signature = [], None
+			if entity.visible and key in child_ids:
+				new_rects, new_signature = self._entity_rects(entity, origin), self._entity_signature(entity)
+				self._baked_rects[key] = (entity, new_rects, new_signature)
+
+			if old_signature is not None and old_signature == new_signature and len(old_rects) == len(new_rects) == 1:
+				# Only the parts of the old and new areas that don't overlap have changed
+				self._dirty_rects += utils.subtract_rect(old_rects[0], new_rects[0]) + utils.subtract_rect(new_rects[0], old_rects[0])
+			else:
+				self._dirty_rects += old_rects + new_rects
+		self._dirty_entities.clear()
+
+		stage, background = self._baked_stage, self.background_tile
+		for rect in self._dirty_rects:
+			for y in range(rect[1], rect[3]):
+				stage[y][rect[0]:rect[2]] = [background] * (rect[2] - rect[0])
+				self._baked_rows[y] = None
+			for entity in entity_list:
+				if any(utils.rects_overlap(rect, r) for r in self._baked_rects.get(id(entity), (None, [], None))[1]):
+					self._blit(stage, entity, origin, rect)
+		self._dirty_rects.clear()
+
+		return stage
+
+	def _get_baked_rows(self) -> list[str]:
+		"""Return the rows of the cached render joined into strings. Rows are only joined again after something on them was redrawn"""
+		for y, row in enumerate(self._baked_rows):
+			if row is None:
+				self._baked_rows[y] = "".join(self._baked_stage[y])
+		return self._baked_rows
+
 	def render(self, is_display=True, layers: list=None, run_functions=True, *, _output=True, show_coord_numbers=False, use_rewrite=True, use_clear=False):
 		"""This will print out all the entities that are part of the scene with their current settings. The character `¶` can be used as a whitespace in Sprites, as regular ` ` characters are considered transparent, unless the transparent parameter is disabled, in which case all whitespaces are rendered over the background.
 
@@ -437,19 +774,19 @@ class Scene:
 		`reprint_render` determines if the render will replace the old render or simply print after it. The latter will allow you to scroll up and see your screen history
 		"""
 
-		stage = [[self.background_tile] * self.size[0] for _ in range(self.size[1])] # Create the render 'stage'
-		entity_list = list(filter(lambda x: x.layer in layers, self.children)) if layers and layers != [-1] else self.children # Get a list of the entities the user wants to render
-		entity_list = list(filter(lambda x: x.visible, entity_list))
-		for entity in sorted(entity_list, key=lambda x: x.layer, reverse=True):
-			# Add each pixel of an entity to the stage
-			end = txtcolours.END if entity.colour else ''
-			for position in entity.all_positions:
-				position += self.origin
-				position %= self.size
-				pixel = entity.get_pixel(
-					(position - entity.pos - self.origin) % self.size
-				)[0].replace(self._void_char,' ')
-				stage[position[1]][position[0]] = f"{entity.colour}{pixel}{end}"
+		origin = self.origin
+		rows = None
+		if layers and layers != [-1]:
+			stage = [[self.background_tile] * self.size[0] for _ in range(self.size[1])] # Create the render 'stage'
+			for entity in self._get_render_order():
+				if entity.visible and entity.layer in layers: # Only the entities the user wants to render
+					self._blit(stage, entity, origin)
+		else:
+			baked = self._bake(origin)
+			if is_display and not show_coord_numbers and not self.debug_display:
+				rows = self._get_baked_rows()[:]
+			# The cached stage is reused by the next render, so it is only copied if it will be edited or returned
+			stage = [row[:] for row in baked] if _output or rows is None else None
 
 		for i, line in enumerate(self.debug_display.split("\n")):
 			for j in range(len(line)):
@@ -460,7 +797,8 @@ class Scene:
 				function()
 
 		if is_display:
-			print(self._render_stage(stage, show_coord_numbers, use_rewrite, use_clear))
+			frame = self._frame(rows, use_rewrite, use_clear) if rows else self._render_stage(stage, show_coord_numbers, use_rewrite, use_clear)
+			self._display(frame)
 		if _output:
 			return stage
 
@@ -470,11 +808,20 @@ class Scene:
 
 	def get_entities_at(self, pos: Vec2D, layers: list[int]=[]) -> list[Entity]:
 		"""Return all entities found at the chosen position, can be filtered by layer"""
+		return list(filter(lambda x: x.contains(pos), self._get_entities_on_layers(layers)))
+
+	def get_occupied_positions(self, layers: list[int]=[], exclude: list[RawEntity]=[]) -> set[tuple]:
+		"""Return the positions of all entities on the chosen layers as a set of `(x, y)` tuples. Use this instead of `is_entity_at` when checking lots of positions while nothing moves, as the entities are only looked at once"""
+		return {
+			(position[0], position[1])
+			for entity in self._get_entities_on_layers(layers) if entity not in exclude
+			for position in entity.all_positions
+		}
+
+	def _get_entities_on_layers(self, layers: list[int]) -> list[RawEntity]:
 		layers = layers if isinstance(layers, list) else [layers]
 		layers = layers if layers != [-1] else []
-		entities: list[Entity] = list(filter(lambda x: x.layer in layers, self.children)) if layers else self.children
-
-		return list(filter(lambda x: pos in x.all_positions, entities))
+		return list(filter(lambda x: x.layer in layers, self.children)) if layers else self.children
 
 # prepares for the first render
-print("\n" * (os.get_terminal_size().lines))
\ No newline at end of file
+print("\n" * utils.get_terminal_lines())
\ No newline at end of file
@@ -1,4 +1,4 @@
-import sys, time, enum, math
+import sys, time, enum, math, shutil, signal
 
 class MorphDict:
 	"""## MorphDict
@@ -43,17 +43,50 @@ class Axis(enum.Enum):
 
 def printd(*texts: str, delay=0.01, skip_delay_characters=[" "]):
 	"""Delayed print function. A simple print function that can be used in place of the usual print to have your text print out character by character, like in text adventure games!"""
-	for i in "".join(texts):
-		sys.stdout.write(i)
-		sys.stdout.flush()
+	text = "".join(texts)
+	if delay <= 0:
+		print(text)
+		return
+
+	skip_delay_characters = frozenset(skip_delay_characters)
+	chunk = ""
+	for i in text:
+		chunk += i
 		if i not in skip_delay_characters:
+			# Characters without a delay are written together with the next one that has one
+			sys.stdout.write(chunk)
+			sys.stdout.flush()
+			chunk = ""
 			time.sleep(delay)
-	print()
+	print(chunk)
 
 def sleep(secs: float):
 	"""Delay execution for a given amount seconds"""
 	time.sleep(secs)
 
+_terminal_lines = shutil.get_terminal_size().lines
+_terminal_lines_checked = time.monotonic()
+_on_resize = None
+
+def get_terminal_lines() -> int:
+	"""Return the height of the terminal. While gemini's handler for the terminal's resize signal is in place this is only looked up again after a resize. Elsewhere, or once something else (like curses) has replaced that handler, it is looked up at most once a second"""
+	global _terminal_lines, _terminal_lines_checked
+	if time.monotonic() - _terminal_lines_checked > 1 and (_on_resize is None or signal.getsignal(signal.SIGWINCH) is not _on_resize):
+		_terminal_lines, _terminal_lines_checked = shutil.get_terminal_size().lines, time.monotonic()
+	return _terminal_lines
+
+if hasattr(signal, "SIGWINCH"): # Not available on Windows
+	def _on_resize(signum, frame):
+		global _terminal_lines
+		_terminal_lines = shutil.get_terminal_size().lines
+		if callable(_previous_resize_handler):
+			_previous_resize_handler(signum, frame)
+
+	try:
+		_previous_resize_handler = signal.signal(signal.SIGWINCH, _on_resize)
+	except ValueError: # Signal handlers can only be set from the main thread
+		_on_resize = None
+
 def parametrized(dec):
 	"""Parameters for wrapper functions, like
 	`@yourwrapper(param=True)`"""
@@ -116,8 +149,9 @@ class Vec2D:
 	Vec2D(6, 9)"""
 
 	def __init__(self, x: list|int, y:int=None):
-		self.y = int(x[1] if isinstance(x, list|tuple|Vec2D) else y)
-		self.x = int(x[0] if isinstance(x, list|tuple|Vec2D) else x)
+		if isinstance(x, list|tuple|Vec2D):
+			x, y = x[0], x[1]
+		self.x, self.y = int(x), int(y)
 
 	def __repr__(self):
 		return (self.x, self.y)
@@ -126,12 +160,12 @@ class Vec2D:
 	def __getitem__(self, i: int):
 		if i > 1:
 			raise IndexError("Vec2D has no elements outside of x and y")
-		return self.__repr__()[i]
+		return (self.x, self.y)[i]
 	def __add__(self, value: 'Vec2D'):
-		return Vec2D(self[0]+value[0], self[1]+value[1])
+		return Vec2D(self.x+value[0], self.y+value[1])
 	__radd__ = __add__
 	def __sub__(self, value: 'Vec2D'):
-		return Vec2D(self[0]-value[0], self[1]-value[1])
+		return Vec2D(self.x-value[0], self.y-value[1])
 	__rsub__ = __sub__
 	def __mul__(self, value: int):
 		return Vec2D(self.x*value,self.y*value)
@@ -139,10 +173,7 @@ class Vec2D:
 	def __truediv__(self, value: int):
 		return Vec2D(self.x/value,self.y/value)
 	def __mod__(self, limits: 'Vec2D'):
-		return Vec2D(list(map(
-			lambda x, y: x%y if x >= 0 else (y + x)%y,
-			self, limits
-		)))
+		return Vec2D(self.x % limits[0], self.y % limits[1])
 	def __eq__(self, value: 'Vec2D') -> bool:
 		return self.__repr__() == Vec2D(value).__repr__()
 	def __gt__(self, value: 'Vec2D') -> bool:
@@ -164,17 +195,18 @@ class Vec2DFloat(Vec2D):
 	Vec2DFloat(5.5, 9)"""
 
 	def __init__(self, x: list|float, y:float=None):
-		self.y = float(x[1] if isinstance(x, list|tuple|Vec2D) else y)
-		self.x = float(x[0] if isinstance(x, list|tuple|Vec2D) else x)
+		if isinstance(x, list|tuple|Vec2D):
+			x, y = x[0], x[1]
+		self.x, self.y = float(x), float(y)
 
 	def to_int(self):
 		return Vec2D(self)
 
 	def __add__(self, value: 'Vec2DFloat'):
-		return Vec2DFloat(self[0]+value[0], self[1]+value[1])
+		return Vec2DFloat(self.x+value[0], self.y+value[1])
 	__radd__ = __add__
 	def __sub__(self, value: 'Vec2DFloat'):
-		return Vec2DFloat(self[0]-value[0], self[1]-value[1])
+		return Vec2DFloat(self.x-value[0], self.y-value[1])
 	__rsub__ = __sub__
 	def __mul__(self, value: float):
 		return Vec2DFloat(self.x*value,self.y*value)
@@ -182,10 +214,7 @@ class Vec2DFloat(Vec2D):
 	def __truediv__(self, value: float):
 		return Vec2DFloat(self.x/value,self.y/value)
 	def __mod__(self, limits: 'Vec2DFloat'):
-		return Vec2DFloat(list(map(
-			lambda x, y: x%y if x >= 0 else (y + x)%y,
-			self, limits
-		)))
+		return Vec2DFloat(self.x % limits[0], self.y % limits[1])
 
 def ccw(A,B,C):
     return (C.y-A.y) * (B.x-A.x) > (B.y-A.y) * (C.x-A.x)
@@ -196,6 +225,34 @@ def intersect(A,B,C,D):
 def is_clockwise(points: list[Vec2D]):
 	return sum((p1.x-p2.x)*(p1.y+p2.y) for p1, p2 in zip(points, points[-1:]+points[:-1])) < 0
 
+def wrap_rect(pos: Vec2D, size: Vec2D, limits: Vec2D) -> list[tuple]:
+	"""Split a rectangle that wraps around the edges of an area of size `limits` into `(x1, y1, x2, y2)` rectangles that don't. End coordinates are exclusive"""
+	x, y = pos[0] % limits[0], pos[1] % limits[1]
+	w, h = min(size[0], limits[0]), min(size[1], limits[1])
+	if w <= 0 or h <= 0:
+		return []
+	xs = [(x, x + w)] if x + w <= limits[0] else [(x, limits[0]), (0, x + w - limits[0])]
+	ys = [(y, y + h)] if y + h <= limits[1] else [(y, limits[1]), (0, y + h - limits[1])]
+	return [(x1, y1, x2, y2) for y1, y2 in ys for x1, x2 in xs]
+
+def rects_overlap(a: tuple, b: tuple) -> bool:
+	"""Return true if the `(x1, y1, x2, y2)` rectangles a and b share any area"""
+	return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+def subtract_rect(a: tuple, b: tuple) -> list[tuple]:
+	"""Return the parts of rectangle a that aren't covered by rectangle b, as up to four rectangles"""
+	if not rects_overlap(a, b):
+		return [a]
+	x1, y1, x2, y2 = a
+	top, bottom = max(y1, b[1]), min(y2, b[3])
+	pieces = [
+		(x1, y1, x2, top), # above b
+		(x1, bottom, x2, y2), # below b
+		(x1, top, max(x1, b[0]), bottom), # left of b
+		(min(x2, b[2]), top, x2, bottom), # right of b
+	]
+	return [r for r in pieces if r[0] < r[2] and r[1] < r[3]]
+
 def hsv_to_rgb(h,s,v):
 	"""converts hsv to rgb, uses 0-255 range all around"""
 	h /= 255